@@ -10,6 +10,7 @@ import numpy as np
 import json
 import os
 from pathlib import Path
+from monitoring import DriftMonitor
 
 app = Flask(__name__)
 CORS(app)
@@ -22,9 +23,10 @@ FEATURE_INFO_PATH = Path("data/indian_feature_info.json")
 model = None
 encoders = None
 feature_info = None
+drift_monitor = None
 
 def load_models():
-    global model, encoders, feature_info
+    global model, encoders, feature_info, drift_monitor
     try:
         if MODEL_PATH.exists():
             with open(MODEL_PATH, 'rb') as f:
@@ -40,6 +42,10 @@ def load_models():
             with open(FEATURE_INFO_PATH, 'r') as f:
                 feature_info = json.load(f)
             print("✅ Feature info loaded successfully!")
+
+            if 'drift_reference' in feature_info:
+                drift_monitor = DriftMonitor(feature_info['drift_reference'])
+                print("✅ Drift monitor initialized!")
     except Exception as e:
         print(f"❌ Error loading models: {e}")
 
@@ -107,6 +113,9 @@ def predict():
             predicted_price_lakhs = max(5, prediction)
             predicted_price_inr = predicted_price_lakhs * 100000
 
+            if drift_monitor:
+                drift_monitor.observe(data, prediction)
+
             # Get dynamic model info if available
             accuracy = "80.97%"
             confidence = 85.2
@@ -182,12 +191,19 @@ def get_samples():
     ]
     return jsonify({"status": "success", "data": samples})
 
+@app.route('/api/drift', methods=['GET'])
+def get_drift():
+    if not drift_monitor:
+        return jsonify({"status": "error", "message": "Drift reference not loaded"}), 500
+    return jsonify({"status": "success", "data": drift_monitor.report()})
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     return jsonify({
         "status": "healthy",
         "model_loaded": model is not None,
         "encoders_loaded": encoders is not None,
+        "drift_monitor_loaded": drift_monitor is not None,
         "message": "Indian House Price Prediction API is running!"
     })
 
@@ -0,0 +1,163 @@
+"""
+Drift Monitoring for Indian House Price Prediction
+Constant-memory streaming sketches of live inputs and predictions, scored against a training reference
+"""
+
+import bisect
+import math
+import threading
+
+import numpy as np
+
+NUM_BINS = 10
+PSI_EPSILON = 1e-4
+PSI_THRESHOLDS = {'moderate': 0.1, 'significant': 0.25}
+
+
+def _quantile_edges(values, num_bins=NUM_BINS):
+    """Interior quantile cut points; duplicates collapse for discrete features"""
+    quantiles = np.linspace(0, 1, num_bins + 1)[1:-1]
+    edges = np.unique(np.quantile(values, quantiles))
+    return [float(edge) for edge in edges if edge > values.min()]
+
+
+def _numeric_reference(values):
+    """Quantile edges plus the share of reference values falling in each bin"""
+    values = np.asarray(values, dtype=float)
+    edges = _quantile_edges(values)
+    bins = np.searchsorted(edges, values, side='right')
+    counts = np.bincount(bins, minlength=len(edges) + 1)
+    return {
+        'edges': edges,
+        'proportions': [float(c) for c in counts / len(values)]
+    }
+
+
+def build_drift_reference(df, predictions, numerical_features, categorical_features):
+    """Build the reference sketches persisted next to the model at training time"""
+    return {
+        'numerical': {f: _numeric_reference(df[f]) for f in numerical_features},
+        'categorical': {
+            f: {'proportions': {str(k): float(v) for k, v in df[f].value_counts(normalize=True).items()}}
+            for f in categorical_features
+        },
+        'prediction': _numeric_reference(predictions)
+    }
+
+
+def _psi(expected, actual):
+    """Population Stability Index between two binned distributions"""
+    score = 0.0
+    for e, a in zip(expected, actual):
+        e = max(e, PSI_EPSILON)
+        a = max(a, PSI_EPSILON)
+        score += (a - e) * math.log(a / e)
+    return score
+
+
+def _ks(expected, actual):
+    """Kolmogorov-Smirnov statistic evaluated on the shared bin edges"""
+    cum_e = cum_a = ks = 0.0
+    for e, a in zip(expected, actual):
+        cum_e += e
+        cum_a += a
+        ks = max(ks, abs(cum_a - cum_e))
+    return ks
+
+
+def _severity(psi):
+    if psi >= PSI_THRESHOLDS['significant']:
+        return 'significant'
+    if psi >= PSI_THRESHOLDS['moderate']:
+        return 'moderate'
+    return 'stable'
+
+
+class NumericSketch:
+    """Histogram over the reference quantile edges; O(log bins) update, fixed size"""
+
+    def __init__(self, reference):
+        self.edges = reference['edges']
+        self.expected = reference['proportions']
+        self.counts = [0] * len(self.expected)
+        self.count = 0
+
+    def update(self, value):
+        self.counts[bisect.bisect_right(self.edges, value)] += 1
+        self.count += 1
+
+    def score(self):
+        if not self.count:
+            return {'count': 0, 'psi': None, 'ks': None, 'severity': None}
+        actual = [c / self.count for c in self.counts]
+        psi = _psi(self.expected, actual)
+        return {
+            'count': self.count,
+            'psi': round(psi, 4),
+            'ks': round(_ks(self.expected, actual), 4),
+            'severity': _severity(psi)
+        }
+
+
+class CategoricalSketch:
+    """Count table over the reference categories plus a single unknown bucket"""
+
+    def __init__(self, reference):
+        self.expected = reference['proportions']
+        self.counts = dict.fromkeys(self.expected, 0)
+        self.unknown = 0
+        self.count = 0
+
+    def update(self, value):
+        value = str(value)
+        if value in self.counts:
+            self.counts[value] += 1
+        else:
+            self.unknown += 1
+        self.count += 1
+
+    def score(self):
+        if not self.count:
+            return {'count': 0, 'psi': None, 'unknown_rate': None, 'severity': None}
+        expected = list(self.expected.values()) + [0.0]
+        actual = [self.counts[k] / self.count for k in self.expected] + [self.unknown / self.count]
+        psi = _psi(expected, actual)
+        return {
+            'count': self.count,
+            'psi': round(psi, 4),
+            'unknown_rate': round(self.unknown / self.count, 4),
+            'severity': _severity(psi)
+        }
+
+
+class DriftMonitor:
+    """Thread-safe collection of per-feature and prediction sketches; raw requests are never stored"""
+
+    def __init__(self, reference):
+        self._lock = threading.Lock()
+        self.numerical = {f: NumericSketch(r) for f, r in reference['numerical'].items()}
+        self.categorical = {f: CategoricalSketch(r) for f, r in reference['categorical'].items()}
+        self.prediction = NumericSketch(reference['prediction'])
+
+    def observe(self, features, prediction):
+        with self._lock:
+            for feature, sketch in self.numerical.items():
+                sketch.update(float(features[feature]))
+            for feature, sketch in self.categorical.items():
+                sketch.update(features[feature])
+            self.prediction.update(float(prediction))
+
+    def report(self):
+        with self._lock:
+            numerical = {f: s.score() for f, s in self.numerical.items()}
+            categorical = {f: s.score() for f, s in self.categorical.items()}
+            prediction = self.prediction.score()
+
+        drifted = [f for f, s in {**numerical, **categorical}.items() if s['severity'] == 'significant']
+        return {
+            'observations': prediction['count'],
+            'prediction': prediction,
+            'numerical': numerical,
+            'categorical': categorical,
+            'drifted_features': drifted
+        }
@@ -13,8 +13,13 @@ from sklearn.metrics import r2_score, mean_absolute_error
 import pickle
 import json
 import os
+import sys
 import random
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monitoring import build_drift_reference
+
 def create_indian_housing_data():
     """Create realistic Indian housing dataset"""
     print("🏗️ Creating Indian housing dataset...")
@@ -211,6 +216,14 @@ def main():
     print("💾 Model saved to models/indian_house_price_model.pkl")
     print("💾 Encoders saved to models/feature_encoders.pkl")
 
+    # Reference sketches for live drift monitoring
+    X_all = df[feature_columns].copy()
+    for feature, encoder in encoders.items():
+        X_all[feature] = encoder.transform(X_all[feature])
+    numerical_features = [f for f in feature_columns if f not in encoders]
+    drift_reference = build_drift_reference(df, model.predict(X_all),
+                                            numerical_features, list(encoders))
+
     # Save feature info
     feature_info = {
         'model_performance': {
@@ -224,7 +237,8 @@ def main():
             'max': float(df['Price_Lakhs'].max()),
             'mean': float(df['Price_Lakhs'].mean()),
             'std': float(df['Price_Lakhs'].std())
-        }
+        },
+        'drift_reference': drift_reference
     }
 
     with open('data/indian_feature_info.json', 'w') as f:
@@ -86,5 +86,15 @@ class TestHousePriceAPI(unittest.TestCase):
 
         self.assertEqual(response.status_code, 400)
 
+    def test_drift_report(self):
+        """Test drift endpoint"""
+        response = self.app.get('/api/drift')
+        self.assertIn(response.status_code, [200, 500])
+
+        data = json.loads(response.data)
+        if response.status_code == 200:
+            self.assertEqual(data['status'], 'success')
+            self.assertIn('drifted_features', data['data'])
+
 if __name__ == '__main__':
     unittest.main()
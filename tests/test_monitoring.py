@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Unit tests for drift monitoring sketches
+"""
+
+import unittest
+import sys
+import os
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from monitoring import DriftMonitor, build_drift_reference
+
+class TestDriftMonitor(unittest.TestCase):
+    def setUp(self):
+        """Build a reference from a small training frame"""
+        self.df = pd.DataFrame({
+            'Size_in_SqFt': list(range(400, 4000, 36)),
+            'City': ['mumbai', 'pune'] * 50
+        })
+        reference = build_drift_reference(self.df, self.df['Size_in_SqFt'] / 10,
+                                          ['Size_in_SqFt'], ['City'])
+        self.monitor = DriftMonitor(reference)
+
+    def test_empty_report(self):
+        """Test report before any observations"""
+        report = self.monitor.report()
+        self.assertEqual(report['observations'], 0)
+        self.assertIsNone(report['numerical']['Size_in_SqFt']['psi'])
+
+    def test_matching_traffic_is_stable(self):
+        """Test traffic drawn from the reference distribution"""
+        for _, row in self.df.iterrows():
+            self.monitor.observe(row, row['Size_in_SqFt'] / 10)
+
+        report = self.monitor.report()
+        self.assertEqual(report['observations'], len(self.df))
+        self.assertEqual(report['numerical']['Size_in_SqFt']['severity'], 'stable')
+        self.assertEqual(report['categorical']['City']['unknown_rate'], 0)
+        self.assertEqual(report['drifted_features'], [])
+
+    def test_shifted_traffic_is_flagged(self):
+        """Test out-of-distribution sizes and unseen cities"""
+        for _ in range(50):
+            self.monitor.observe({'Size_in_SqFt': 9000, 'City': 'atlantis'}, 900)
+
+        report = self.monitor.report()
+        self.assertEqual(report['numerical']['Size_in_SqFt']['severity'], 'significant')
+        self.assertEqual(report['categorical']['City']['unknown_rate'], 1.0)
+        self.assertEqual(report['prediction']['severity'], 'significant')
+        self.assertIn('City', report['drifted_features'])
+
+if __name__ == '__main__':
+    unittest.main()